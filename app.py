@@ -1,11 +1,20 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import numpy as np
+import orjson
 from functools import wraps
+import hashlib
 import logging
+from array import array
+from collections import defaultdict
+from itertools import islice
 from datetime import datetime
-from typing import Dict, Any, Optional
-import traceback
+from typing import Dict, Any, Optional, Tuple, Union
 import os
+import threading
+import traceback
+import time
 
 # Importaciones simuladas - en un entorno real, estos serían módulos reales
 # from datatypes import SistemaQuantumBiMoType, PaqueteBiMoType
@@ -13,7 +22,25 @@ import os
 
 # ==================== CONFIGURACIÓN DE LA APLICACIÓN ====================
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Proveedor JSON de Flask respaldado por orjson"""
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Permitir CORS para desarrollo frontend
 
 # Configuración
@@ -21,61 +48,191 @@ app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'quantum-secret-key-dev'
 app.config['DEBUG'] = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
 
 # Configurar logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+class InnermostTracebackFormatter(logging.Formatter):
+    """Formateador que conserva solo los frames más internos de cada traza"""
+    limit = -10
+
+    def formatException(self, ei) -> str:
+        return ''.join(traceback.format_exception(*ei, limit=self.limit)).rstrip('\n')
+
+# El formato no usa hilo ni proceso; evitar recolectarlos en cada registro
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+log_handler = logging.StreamHandler()
+# Limitar el tamaño de las trazas registradas fuera de desarrollo
+log_handler.setFormatter(
+    logging.Formatter(log_format) if app.config['DEBUG']
+    else InnermostTracebackFormatter(log_format)
 )
+logging.basicConfig(level=logging.INFO, handlers=[log_handler])
 logger = logging.getLogger(__name__)
 
 # ==================== SIMULACIÓN DE CLASES (reemplazar por las reales) ====================
 
 class MockSistemaQuantumBiMoType:
     """Simulación de la clase SistemaQuantumBiMoType"""
-    def encode_quantum_message(self, message: str) -> Dict[str, Any]:
+    def encode_quantum_message(self, message: str, now_iso: Optional[str] = None) -> Dict[str, Any]:
         return {
-            'id_mensaje': 'BiMO-' + str(hash(message))[:8],
-            'timestamp': datetime.utcnow().isoformat(),
+            'id_mensaje': 'BiMO-' + hashlib.blake2b(message.encode(), digest_size=4).hexdigest(),
+            'timestamp': now_iso or datetime.utcnow().isoformat(),
             'quantum_data': f'encoded_{message}',
             'qubits_count': len(message)
         }
     
-    def decode_quantum_transmission(self, paquete: Dict, measurements: list) -> Dict[str, Any]:
+    def decode_quantum_transmission(self, paquete: Dict, measurements: list,
+                                    energies: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        if energies is None:
+            energies = measurement_energies(measurements)
+        with np.errstate(over='ignore', invalid='ignore'):
+            energia_media = np.mean(energies)
+            energia_desviacion = np.std(energies)
+        if not (np.isfinite(energia_media) and np.isfinite(energia_desviacion)):
+            raise ValueError("Las energías medidas producen métricas no finitas")
         return {
             'mensaje_decodificado': 'QUANTUM MESSAGE DECODED',
             'estado': 'SUCCESS',
             'metricas_cuanticas': {
                 'fidelidad': 0.95,
                 'error_rate': 0.05,
-                'coherencia': 0.92
+                'coherencia': 0.92,
+                'energia_media': float(energia_media),
+                'energia_desviacion': float(energia_desviacion)
             }
         }
 
+def _measurement_energy(measurement: Any) -> float:
+    """Extraer 'energia_medida' exigiendo un número JSON (no cadenas ni booleanos)"""
+    value = measurement.get('energia_medida') if isinstance(measurement, dict) else None
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError("Cada medición debe incluir un 'energia_medida' numérico")
+    return value
+
+def measurement_energies(measurements: list) -> np.ndarray:
+    """Convertir las mediciones a un arreglo contiguo de energías"""
+    try:
+        return np.fromiter(
+            (_measurement_energy(m) for m in measurements),
+            dtype=np.float64,
+            count=len(measurements)
+        )
+    except OverflowError:
+        raise ValueError("Cada medición debe incluir un 'energia_medida' numérico")
+
+class PackageColumns:
+    """Resumen de paquetes de un usuario en columnas paralelas (SoA)"""
+    __slots__ = ('ids', 'timestamps', 'encoding_types', 'qubits_counts', '_positions')
+    
+    def __init__(self):
+        self.ids = []
+        self.timestamps = []
+        self.encoding_types = []
+        self.qubits_counts = array('i')  # int32 contiguos
+        self._positions = {}  # id_mensaje -> fila
+    
+    def upsert(self, paquete: Dict) -> None:
+        package_id = paquete['id_mensaje']
+        row = self._positions.get(package_id)
+        timestamp = paquete['timestamp']
+        encoding_type = paquete.get('encoding_type', 'BiMO')
+        qubits_count = paquete.get('qubits_count', 0)
+        
+        if row is None:
+            self._positions[package_id] = len(self.ids)
+            self.ids.append(package_id)
+            self.timestamps.append(timestamp)
+            self.encoding_types.append(encoding_type)
+            self.qubits_counts.append(qubits_count)
+        else:
+            self.timestamps[row] = timestamp
+            self.encoding_types[row] = encoding_type
+            self.qubits_counts[row] = qubits_count
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def rows(self):
+        return zip(self.ids, self.timestamps, self.encoding_types, self.qubits_counts)
+
 class MockDatabase:
     """Simulación de la clase Database"""
+    SHARD_COUNT = 16  # Potencia de 2 para seleccionar el shard con una máscara
+    
     def __init__(self):
         self.storage = {}
         self.metrics = {}
+        self.by_id = {}  # Índice secundario: id_mensaje -> paquete
+        self.by_user = defaultdict(PackageColumns)  # user_id -> columnas de resumen
+        # Los paquetes solo se agregan o reemplazan, así que las lecturas no toman lock;
+        # las escrituras se serializan por usuario con un lock por shard
+        self._shard_locks = tuple(threading.RLock() for _ in range(self.SHARD_COUNT))
+    
+    def _shard_lock(self, user_id: str) -> threading.RLock:
+        return self._shard_locks[hash(user_id) & (self.SHARD_COUNT - 1)]
     
     def save_transmission_history(self, user_id: str, paquete: Dict) -> bool:
         key = f"{user_id}_{paquete['id_mensaje']}"
-        self.storage[key] = paquete
-        logger.info(f"Paquete guardado: {key}")
+        with self._shard_lock(user_id):
+            previous = self.storage.get(key)
+            self.storage[key] = paquete
+            # El primer usuario que guarda un id conserva la entrada del índice;
+            # solo su propio reemplazo la actualiza (como el recorrido original)
+            current = self.by_id.setdefault(paquete['id_mensaje'], paquete)
+            if previous is not None and current is previous:
+                self.by_id[paquete['id_mensaje']] = paquete
+            self.by_user[user_id].upsert(paquete)
+        logger.info("Paquete guardado: %s", key)
         return True
     
+    def get_user_columns(self, user_id: str) -> Tuple[Optional[PackageColumns], int]:
+        """Columnas del usuario y número de filas completas en este instante"""
+        with self._shard_lock(user_id):
+            columns = self.by_user.get(user_id)
+            return columns, len(columns) if columns else 0
+    
     def get_package_by_id(self, package_id: str) -> Optional[Dict]:
-        for key, value in self.storage.items():
-            if value['id_mensaje'] == package_id:
-                return value
-        return None
+        return self.by_id.get(package_id)
     
     def update_metrics(self, package_id: str, metrics: Dict) -> bool:
         self.metrics[package_id] = metrics
-        logger.info(f"Métricas actualizadas para: {package_id}")
+        logger.info("Métricas actualizadas para: %s", package_id)
         return True
 
 class MockAuthService:
     """Simulación del servicio de autenticación"""
+    TOKEN_CACHE_TTL = 60.0  # Segundos que un token verificado se considera válido
+    TOKEN_CACHE_MAXSIZE = 4096
+    
+    def __init__(self):
+        self._valid: Dict[str, Tuple[Dict, float]] = {}  # token -> (usuario, expira_en)
+        self._revoked: set = set()
+        self._lock = threading.Lock()
+    
     def get_user_from_token(self, token: str) -> Optional[Dict]:
+        if token in self._revoked:
+            return None
+        
+        now = time.monotonic()
+        hit = self._valid.get(token)
+        if hit and hit[1] > now:
+            return hit[0]
+        
+        user = self._verify_token(token)
+        if user:
+            with self._lock:
+                if len(self._valid) >= self.TOKEN_CACHE_MAXSIZE:
+                    # Descartar la entrada más antigua
+                    self._valid.pop(next(iter(self._valid)), None)
+                self._valid[token] = (user, now + self.TOKEN_CACHE_TTL)
+        return user
+    
+    def revoke_token(self, token: str) -> None:
+        with self._lock:
+            self._revoked.add(token)
+            self._valid.pop(token, None)
+    
+    def _verify_token(self, token: str) -> Optional[Dict]:
         # En producción, aquí validarías el JWT o token de sesión
         if token and token.startswith('valid_'):
             return {
@@ -93,77 +250,103 @@ auth_service = MockAuthService()
 
 # ==================== DECORADORES Y MIDDLEWARE ====================
 
-def require_auth(f):
-    """Decorador para requerir autenticación"""
+def auth_and_errors(f):
+    """Decorador que requiere autenticación y centraliza el manejo de errores"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
         auth_token = request.headers.get('Authorization')
-        if not auth_token and request.is_json:
-            auth_token = request.json.get('auth_token')
+        # Solo se parsea el cuerpo si falta la cabecera; el resultado queda en caché
+        if auth_token is None and request.is_json:
+            data = request.get_json(silent=True, cache=True)
+            if isinstance(data, dict):
+                auth_token = data.get('auth_token')
         
         if not auth_token:
-            return jsonify({
-                'status': 'error',
-                'message': 'Token de autorización requerido',
-                'code': 'UNAUTHORIZED'
-            }), 401
+            return jsonify(
+                status=_ERR_STATUS,
+                message='Token de autorización requerido',
+                code='UNAUTHORIZED'
+            ), 401
         
         # Remover "Bearer " si está presente
-        if auth_token.startswith('Bearer '):
-            auth_token = auth_token[7:]
+        auth_token = auth_token.removeprefix('Bearer ')
         
         user = auth_service.get_user_from_token(auth_token)
         if not user:
-            return jsonify({
-                'status': 'error',
-                'message': 'Token inválido o expirado',
-                'code': 'INVALID_TOKEN'
-            }), 401
+            return jsonify(
+                status=_ERR_STATUS,
+                message='Token inválido o expirado',
+                code='INVALID_TOKEN'
+            ), 401
         
         request.current_user = user
-        return f(*args, **kwargs)
-    
-    return decorated_function
-
-def handle_api_errors(f):
-    """Decorador para manejo centralizado de errores"""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
+        
         try:
             return f(*args, **kwargs)
         except ValueError as e:
-            logger.warning(f"Error de validación: {str(e)}")
-            return jsonify({
-                'status': 'error',
-                'message': 'Datos de entrada inválidos',
-                'details': str(e),
-                'code': 'VALIDATION_ERROR'
-            }), 400
+            logger.warning("Error de validación: %s", e)
+            return jsonify(
+                status=_ERR_STATUS,
+                message='Datos de entrada inválidos',
+                details=str(e),
+                code='VALIDATION_ERROR'
+            ), 400
         except Exception as e:
-            logger.error(f"Error interno: {str(e)}\n{traceback.format_exc()}")
-            return jsonify({
-                'status': 'error',
-                'message': 'Error interno del servidor',
-                'code': 'INTERNAL_ERROR'
-            }), 500
+            logger.exception("Error interno: %s", e)
+            return jsonify(
+                status=_ERR_STATUS,
+                message='Error interno del servidor',
+                code='INTERNAL_ERROR'
+            ), 500
     
     return decorated_function
 
+# ==================== RESPUESTAS PRECALCULADAS ====================
+
+_OK_STATUS = 'success'
+_ERR_STATUS = 'error'
+
+# Cuerpos constantes serializados una sola vez al cargar el módulo
+_HEALTH_BODY_PREFIX = orjson.dumps({
+    'status': _OK_STATUS,
+    'message': 'QuantumLink API está funcionando',
+    'version': '1.0.0'
+})[:-1] + b',"timestamp":"'
+
+_PACKAGES_BODY_PREFIX = orjson.dumps({'status': _OK_STATUS})[:-1] + b',"data":{"packages":['
+
+_NOT_FOUND_BODY = orjson.dumps({
+    'status': _ERR_STATUS,
+    'message': 'Endpoint no encontrado',
+    'code': 'NOT_FOUND'
+})
+
+_METHOD_NOT_ALLOWED_BODY = orjson.dumps({
+    'status': _ERR_STATUS,
+    'message': 'Método HTTP no permitido',
+    'code': 'METHOD_NOT_ALLOWED'
+})
+
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    'status': _ERR_STATUS,
+    'message': 'Error interno del servidor',
+    'code': 'INTERNAL_ERROR'
+})
+
+def json_bytes_response(body: bytes, status: int = 200):
+    """Construir una respuesta JSON a partir de bytes ya serializados"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
 # ==================== RUTAS DE LA API ====================
 
 @app.route('/', methods=['GET'])
 def health_check():
     """Endpoint de verificación de salud"""
-    return jsonify({
-        'status': 'success',
-        'message': 'QuantumLink API está funcionando',
-        'version': '1.0.0',
-        'timestamp': datetime.utcnow().isoformat()
-    })
+    timestamp = datetime.utcnow().isoformat().encode()
+    return json_bytes_response(_HEALTH_BODY_PREFIX + timestamp + b'"}')
 
 @app.route('/api/v1/encode', methods=['POST'])
-@require_auth
-@handle_api_errors
+@auth_and_errors
 def api_encode_message():
     """
     Endpoint para codificar un mensaje cuántico.
@@ -183,47 +366,54 @@ def api_encode_message():
         raise ValueError("Se requiere un cuerpo JSON válido")
     
     message = data.get('message')
-    if not isinstance(message, str) or not message.strip():
+    if not isinstance(message, str):
         raise ValueError("El campo 'message' debe ser una cadena no vacía")
     
+    # Rechazar por longitud antes de copiar la cadena con strip()
     if len(message) > 1000:  # Límite de caracteres
         raise ValueError("El mensaje no puede exceder 1000 caracteres")
     
+    message = message.strip()
+    if not message:
+        raise ValueError("El campo 'message' debe ser una cadena no vacía")
+    
     # Opciones adicionales
     options = data.get('options', {})
     encoding_type = options.get('encoding_type', 'BiMO')
     priority = options.get('priority', 'medium')
     
-    logger.info(f"Codificando mensaje para usuario {request.current_user['id']}")
+    logger.info("Codificando mensaje para usuario %s", request.current_user['id'])
+    
+    # Una sola lectura del reloj por petición
+    now_iso = datetime.utcnow().isoformat()
     
     # Lógica principal: usar la clase cuántica
-    paquete = sistema_bimo.encode_quantum_message(message.strip())
+    paquete = sistema_bimo.encode_quantum_message(message, now_iso=now_iso)
     
     # Agregar metadatos adicionales
     paquete.update({
         'user_id': request.current_user['id'],
         'encoding_type': encoding_type,
         'priority': priority,
-        'created_at': datetime.utcnow().isoformat()
+        'created_at': now_iso
     })
     
     # Almacenar en la base de datos
     db.save_transmission_history(request.current_user['id'], paquete)
     
-    return jsonify({
-        'status': 'success',
-        'data': {
+    return jsonify(
+        status=_OK_STATUS,
+        data={
             'package_id': paquete['id_mensaje'],
             'timestamp': paquete['timestamp'],
             'qubits_count': paquete.get('qubits_count', 0),
             'encoding_type': encoding_type
         },
-        'message': 'Mensaje codificado exitosamente'
-    }), 201
+        message='Mensaje codificado exitosamente'
+    ), 201
 
 @app.route('/api/v1/decode', methods=['POST'])
-@require_auth
-@handle_api_errors
+@auth_and_errors
 def api_decode_message():
     """
     Endpoint para decodificar un paquete cuántico.
@@ -251,135 +441,124 @@ def api_decode_message():
     if not measurements or not isinstance(measurements, list):
         raise ValueError("El campo 'measurements' debe ser una lista no vacía")
     
-    logger.info(f"Decodificando paquete {package_id} para usuario {request.current_user['id']}")
+    energies = measurement_energies(measurements)
+    
+    logger.info("Decodificando paquete %s para usuario %s", package_id, request.current_user['id'])
     
     # Recuperar el paquete original
     paquete_original = db.get_package_by_id(package_id)
     if not paquete_original:
-        return jsonify({
-            'status': 'error',
-            'message': 'Paquete no encontrado',
-            'code': 'PACKAGE_NOT_FOUND'
-        }), 404
+        return jsonify(
+            status=_ERR_STATUS,
+            message='Paquete no encontrado',
+            code='PACKAGE_NOT_FOUND'
+        ), 404
     
     # Verificar que el paquete pertenezca al usuario actual
     if paquete_original.get('user_id') != request.current_user['id']:
-        return jsonify({
-            'status': 'error',
-            'message': 'No tienes permiso para acceder a este paquete',
-            'code': 'FORBIDDEN'
-        }), 403
+        return jsonify(
+            status=_ERR_STATUS,
+            message='No tienes permiso para acceder a este paquete',
+            code='FORBIDDEN'
+        ), 403
     
     # Lógica principal: decodificar
-    resultado = sistema_bimo.decode_quantum_transmission(paquete_original, measurements)
+    resultado = sistema_bimo.decode_quantum_transmission(paquete_original, measurements, energies)
     
     # Almacenar métricas
     db.update_metrics(package_id, resultado.get('metricas_cuanticas', {}))
     
-    return jsonify({
-        'status': 'success',
-        'data': {
+    return jsonify(
+        status=_OK_STATUS,
+        data={
             'package_id': package_id,
             'decoded_message': resultado.get('mensaje_decodificado'),
             'transmission_status': resultado.get('estado'),
             'metrics': resultado.get('metricas_cuanticas'),
             'decoded_at': datetime.utcnow().isoformat()
         },
-        'message': 'Mensaje decodificado exitosamente'
-    })
+        message='Mensaje decodificado exitosamente'
+    )
 
 @app.route('/api/v1/packages', methods=['GET'])
-@require_auth
-@handle_api_errors
+@auth_and_errors
 def get_user_packages():
     """Obtener el historial de paquetes del usuario"""
     user_id = request.current_user['id']
+    # Fijar el total antes de emitir para que coincida con los elementos enviados
+    columns, total_count = db.get_user_columns(user_id)
     
-    # Filtrar paquetes del usuario
-    user_packages = []
-    for key, paquete in db.storage.items():
-        if paquete.get('user_id') == user_id:
+    def generate():
+        yield _PACKAGES_BODY_PREFIX
+        
+        rows = islice(columns.rows(), total_count) if columns else ()
+        separator = b''
+        for package_id, timestamp, encoding_type, qubits_count in rows:
             package_summary = {
-                'package_id': paquete['id_mensaje'],
-                'timestamp': paquete['timestamp'],
-                'encoding_type': paquete.get('encoding_type', 'BiMO'),
-                'qubits_count': paquete.get('qubits_count', 0),
+                'package_id': package_id,
+                'timestamp': timestamp,
+                'encoding_type': encoding_type,
+                'qubits_count': qubits_count,
                 'status': 'encoded'
             }
             
             # Agregar métricas si existen
-            if paquete['id_mensaje'] in db.metrics:
-                package_summary['metrics'] = db.metrics[paquete['id_mensaje']]
+            if package_id in db.metrics:
+                package_summary['metrics'] = db.metrics[package_id]
                 package_summary['status'] = 'decoded'
             
-            user_packages.append(package_summary)
+            yield separator + orjson.dumps(package_summary)
+            separator = b','
+        
+        yield b'],"total_count":%d},"message":' % total_count
+        yield orjson.dumps(f'Se encontraron {total_count} paquetes') + b'}'
     
-    return jsonify({
-        'status': 'success',
-        'data': {
-            'packages': user_packages,
-            'total_count': len(user_packages)
-        },
-        'message': f'Se encontraron {len(user_packages)} paquetes'
-    })
+    return app.response_class(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/api/v1/packages/<package_id>', methods=['GET'])
-@require_auth
-@handle_api_errors
+@auth_and_errors
 def get_package_details(package_id: str):
     """Obtener detalles específicos de un paquete"""
     paquete = db.get_package_by_id(package_id)
     
     if not paquete:
-        return jsonify({
-            'status': 'error',
-            'message': 'Paquete no encontrado',
-            'code': 'PACKAGE_NOT_FOUND'
-        }), 404
+        return jsonify(
+            status=_ERR_STATUS,
+            message='Paquete no encontrado',
+            code='PACKAGE_NOT_FOUND'
+        ), 404
     
     if paquete.get('user_id') != request.current_user['id']:
-        return jsonify({
-            'status': 'error',
-            'message': 'No tienes permiso para acceder a este paquete',
-            'code': 'FORBIDDEN'
-        }), 403
+        return jsonify(
+            status=_ERR_STATUS,
+            message='No tienes permiso para acceder a este paquete',
+            code='FORBIDDEN'
+        ), 403
     
     # Agregar métricas si existen
     metrics = db.metrics.get(package_id)
     
-    return jsonify({
-        'status': 'success',
-        'data': {
+    return jsonify(
+        status=_OK_STATUS,
+        data={
             'package': paquete,
             'metrics': metrics
         }
-    })
+    )
 
 # ==================== MANEJO DE ERRORES GLOBALES ====================
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        'status': 'error',
-        'message': 'Endpoint no encontrado',
-        'code': 'NOT_FOUND'
-    }), 404
+    return json_bytes_response(_NOT_FOUND_BODY, 404)
 
 @app.errorhandler(405)
 def method_not_allowed(error):
-    return jsonify({
-        'status': 'error',
-        'message': 'Método HTTP no permitido',
-        'code': 'METHOD_NOT_ALLOWED'
-    }), 405
+    return json_bytes_response(_METHOD_NOT_ALLOWED_BODY, 405)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
-        'status': 'error',
-        'message': 'Error interno del servidor',
-        'code': 'INTERNAL_ERROR'
-    }), 500
+    return json_bytes_response(_INTERNAL_ERROR_BODY, 500)
 
 # ==================== FUNCIÓN PRINCIPAL ====================
 
@@ -390,8 +569,22 @@ def create_app():
 if __name__ == '__main__':
     logger.info("Iniciando QuantumLink SaaS API...")
     
-    # Configuración para desarrollo
     port = int(os.environ.get('PORT', 5000))
+    
+    # En producción, reemplazar este proceso por gunicorn con un worker por núcleo
+    if os.environ.get('FLASK_ENV') == 'production':
+        workers = os.environ.get('WEB_CONCURRENCY', str(os.cpu_count() or 1))
+        threads = os.environ.get('GUNICORN_THREADS', '4')
+        os.execvp('gunicorn', [
+            'gunicorn',
+            '--worker-class', 'gthread',
+            '--workers', workers,
+            '--threads', threads,
+            '--bind', f'0.0.0.0:{port}',
+            'wsgi:application'
+        ])
+    
+    # Configuración para desarrollo
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
     
     app.run(
@@ -0,0 +1,17 @@
+# wsgi.py - Punto de entrada para servidores de producción
+#
+# WSGI (pre-fork, un worker por núcleo):
+#   gunicorn --worker-class gthread --workers $(nproc) --threads 4 wsgi:application
+#
+# ASGI (requiere asgiref, uvicorn, uvloop y httptools):
+#   uvicorn wsgi:asgi --loop uvloop --http httptools --workers $(nproc)
+from app import create_app
+
+application = create_app()
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:  # asgiref es opcional; solo se necesita para uvicorn
+    asgi = None
+else:
+    asgi = WsgiToAsgi(application)